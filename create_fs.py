@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 import subprocess
 import os
-import tempfile
 import argparse
 import sys
 
@@ -17,10 +16,9 @@ def create_ext2_filesystem(filename, init_elf, size_mb=128):
         return False
     print(f"创建 {size_mb}MB 的ext2(4K) 文件系统映像: {filename}")
 
-    # 1. 创建空的映像文件
+    # 1. 创建空的映像文件；truncate 只扩展逻辑大小，未写区域保持为稀疏空洞
     with open(filename, 'wb') as f:
-        f.seek(size_mb * 1024 * 1024 - 1)
-        f.write(b'\0')
+        f.truncate(size_mb * 1024 * 1024)
 
     # 2. 格式化为 ext2（块大小 4096，卷标 LITEOS）
     try:
@@ -34,7 +32,7 @@ def create_ext2_filesystem(filename, init_elf, size_mb=128):
                         '-O', '^ext_attr,^resize_inode,^dir_index,filetype,sparse_super,large_file,has_journal',
                         '-J', 'size=4',
                         '-L', 'LITEOS', filename],
-                       check=True, capture_output=True)
+                       check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
         print("✓ ext2 文件系统创建成功 (4K block, 4 MiB JBD2 journal)")
     except subprocess.CalledProcessError as e:
         print(f"✗ mke2fs 失败: {e}\n{e.stderr.decode(errors='ignore')}")
@@ -68,30 +66,21 @@ def copy_files_to_ext2(image_path, debugfs_bin, init_elf):
         # 内核按 root execve 语义要求至少一个 execute bit；缺少此 mode 会使 init 在启动时正确被拒绝。
         commands.append(f"set_inode_field {dst} mode 0100755")
 
-    # 写入临时脚本并执行
-    with tempfile.NamedTemporaryFile('w', delete=False) as tf:
-        for line in commands:
-            tf.write(line + "\n")
-        script_path = tf.name
-
+    # 通过 stdin 传入脚本（-f - 表示从标准输入读取命令），无需临时文件
     try:
-        subprocess.run([debugfs_bin, '-w', '-f', script_path, image_path], check=True)
+        subprocess.run([debugfs_bin, '-w', '-f', '-', image_path],
+                       input="\n".join(commands) + "\n", text=True, check=True)
         print("✓ 已将文件写入 ext2 镜像")
     except subprocess.CalledProcessError as e:
         print(f"✗ 写入失败: {e}")
         return False
-    finally:
-        try:
-            os.remove(script_path)
-        except Exception:
-            pass
 
     # 简单列出根目录
+    # debugfs 直接写入继承的 stdout；先 flush 标题，否则管道输出时标题会排在列表之后
     try:
-        print("\n文件系统内容 (根目录):")
-        result = subprocess.run([debugfs_bin, '-R', 'ls -l /', image_path],
-                              capture_output=True, text=True, check=True)
-        print(result.stdout)
+        print("\n文件系统内容 (根目录):", flush=True)
+        subprocess.run([debugfs_bin, '-R', 'ls -l /', image_path],
+                       stderr=subprocess.DEVNULL, check=True)
     except Exception:
         pass
 
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import functools
 import shutil
 import struct
 import subprocess
@@ -10,7 +11,12 @@ from pathlib import Path
 
 ROOT = Path(__file__).resolve().parent.parent
 
+# 工具定位结果按进程缓存：rootfs 组装会对每条 debugfs request 重新定位工具，
+# 未缓存时每次都要重新扫描 PATH 并 stat 候选路径。查找失败抛出的异常不会进入缓存，
+# 因此缺失的工具在安装后仍能在下一次调用中被发现。
 
+
+@functools.cache
 def find_mke2fs() -> Path:
     """返回可执行 mke2fs；PATH 与常见 Homebrew/system 路径均不存在时 fail-stop。"""
     candidates = (
@@ -25,6 +31,7 @@ def find_mke2fs() -> Path:
     raise RuntimeError("mke2fs from e2fsprogs is required")
 
 
+@functools.cache
 def find_debugfs() -> Path:
     """返回可执行 debugfs；PATH 与常见 Homebrew/system 路径均不存在时 fail-stop。"""
     candidates = (
@@ -39,6 +46,7 @@ def find_debugfs() -> Path:
     raise RuntimeError("debugfs from e2fsprogs is required")
 
 
+@functools.cache
 def find_e2fsck() -> Path:
     """返回可执行 e2fsck；PATH 与常见 Homebrew/system 路径均不存在时 fail-stop。"""
     candidates = (
@@ -53,6 +61,7 @@ def find_e2fsck() -> Path:
     raise RuntimeError("e2fsck from e2fsprogs is required")
 
 
+@functools.cache
 def find_resize2fs() -> Path:
     """返回可执行 resize2fs；PATH 与常见 Homebrew/system 路径均不存在时 fail-stop。"""
     candidates = (
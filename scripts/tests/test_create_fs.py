@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+
+import create_fs  # noqa: E402
+from scripts.ext2_image import ext2_capacity_bytes, run_debugfs  # noqa: E402
+
+
+class CreateFsTests(unittest.TestCase):
+    def test_create_installs_boot_layout_and_executable_init(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            image = Path(directory) / "fs.img"
+            init = Path(directory) / "init"
+            shutil.copyfile(sys.executable, init)
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                created = create_fs.create_ext2_filesystem(str(image), str(init), 16)
+
+            self.assertTrue(created)
+            self.assertEqual(ext2_capacity_bytes(image), 16 * 1024 * 1024)
+            root = run_debugfs(image, "ls -p /")
+            for directory_path in create_fs.BOOT_DIRECTORIES:
+                self.assertIn(f"/{directory_path.removeprefix('/')}//", root)
+            metadata = run_debugfs(image, "stat /bin/init")
+            self.assertIn("Mode:  0755", metadata)
+            self.assertIn(f"Size: {init.stat().st_size}", metadata)
+
+
+if __name__ == "__main__":
+    unittest.main()
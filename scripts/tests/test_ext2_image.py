@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import shutil
 import subprocess
 import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 SCRIPTS = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(SCRIPTS))
@@ -12,6 +14,7 @@ sys.path.insert(0, str(SCRIPTS))
 from ext2_image import (  # noqa: E402
     ensure_ext2_capacity,
     ext2_capacity_bytes,
+    find_debugfs,
     find_mke2fs,
 )
 
@@ -47,6 +50,16 @@ class Ext2ImageTests(unittest.TestCase):
             self.assertEqual(image.stat().st_size, expected)
             self.assertEqual(ext2_capacity_bytes(image), expected)
 
+    def test_tool_lookup_scans_path_once_per_process(self) -> None:
+        find_debugfs.cache_clear()
+        self.addCleanup(find_debugfs.cache_clear)
+        with patch("ext2_image.shutil.which", wraps=shutil.which) as which:
+            first = find_debugfs()
+            second = find_debugfs()
+
+        self.assertEqual(first, second)
+        which.assert_called_once_with("debugfs")
+
 
 if __name__ == "__main__":
     unittest.main()